@@ -4,9 +4,25 @@
 """
 import json
 import os
+import functools
 from typing import Dict, Any, Optional
 import logging
 
+# 优先使用orjson进行JSON编解码，未安装时回退到标准库json
+try:
+    import orjson
+    
+    def _dump_json(obj: Dict[str, Any]) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                            | orjson.OPT_SERIALIZE_NUMPY)
+    
+    _load_json = orjson.loads
+except ImportError:
+    def _dump_json(obj: Dict[str, Any]) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    
+    _load_json = json.loads
+
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,13 +38,74 @@ DEFAULT_RADIO_CONFIG = {
     "output_format": "complex64"  # 输出数据格式
 }
 
+# 必需的配置项
+REQUIRED_CONFIG_KEYS = ("center_freq", "sample_rate", "gain", "device_id")
+
+# 配置文件的JSON Schema
+CONFIG_SCHEMA = {
+    "type": "object",
+    "required": list(REQUIRED_CONFIG_KEYS),
+    "properties": {
+        "center_freq": {"type": "number", "exclusiveMinimum": 0},
+        "sample_rate": {"type": "number", "exclusiveMinimum": 0}
+    }
+}
+
+# 若安装了fastjsonschema，则在导入时将Schema编译为专用校验函数
+try:
+    import fastjsonschema
+    _config_validator = fastjsonschema.compile(CONFIG_SCHEMA)
+except ImportError:
+    _config_validator = None
+
+@functools.lru_cache(maxsize=8)
+def _read_config_file(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    读取并解析配置文件，结果按 (路径, 修改时间, 文件大小) 缓存
+    
+    文件被修改后缓存键随之变化，自动重新读取
+    
+    Args:
+        file_path: 配置文件路径
+        mtime_ns: 文件修改时间（纳秒）
+        size: 文件大小（字节）
+        
+    Returns:
+        Dict[str, Any]: 解析得到的配置字典（调用方不得修改，需先复制）
+    """
+    with open(file_path, "rb") as file:
+        return _load_json(file.read())
+
 class ConfigHandler:
     """配置处理器类"""
     
+    # 按配置文件绝对路径缓存的共享实例
+    _instances: Dict[str, "ConfigHandler"] = {}
+    
     def __init__(self, config_file: str = "radio_config.json"):
         self.config_file = config_file
         self.config = DEFAULT_RADIO_CONFIG.copy()
     
+    @classmethod
+    def get(cls, config_file: str = "radio_config.json") -> "ConfigHandler":
+        """
+        获取指定配置文件对应的共享配置处理器
+        
+        同一进程内相同路径只创建一个实例
+        
+        Args:
+            config_file: 配置文件路径
+            
+        Returns:
+            ConfigHandler: 该路径对应的配置处理器
+        """
+        key = os.path.abspath(config_file)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls(config_file)
+            cls._instances[key] = instance
+        return instance
+    
     def save_config(self, config_dict: Optional[Dict[str, Any]] = None, 
                    file_path: Optional[str] = None) -> bool:
         """
@@ -50,8 +127,11 @@ class ConfigHandler:
                 logger.error("配置验证失败")
                 return False
             
-            with open(target_file, "w", encoding='utf-8') as file:
-                json.dump(config_to_save, file, indent=2, ensure_ascii=False)
+            with open(target_file, "wb") as file:
+                file.write(_dump_json(config_to_save))
+            
+            # 文件系统时间戳精度有限，写入后主动清除读取缓存
+            _read_config_file.cache_clear()
             
             logger.info(f"配置已保存到 {target_file}")
             return True
@@ -77,8 +157,8 @@ class ConfigHandler:
                 logger.warning(f"配置文件 {target_file} 不存在，使用默认配置")
                 return DEFAULT_RADIO_CONFIG.copy()
             
-            with open(target_file, "r", encoding="utf-8") as file:
-                config = json.load(file)
+            stat = os.stat(target_file)
+            config = _read_config_file(target_file, stat.st_mtime_ns, stat.st_size).copy()
             
             # 验证配置
             if not self._validate_config(config):
@@ -103,10 +183,16 @@ class ConfigHandler:
         Returns:
             bool: 配置是否有效
         """
-        required_keys = ["center_freq", "sample_rate", "gain", "device_id"]
+        if _config_validator is not None:
+            try:
+                _config_validator(config)
+                return True
+            except fastjsonschema.JsonSchemaException as e:
+                logger.error(f"配置验证失败: {e.message}")
+                return False
         
         # 检查必需键
-        for key in required_keys:
+        for key in REQUIRED_CONFIG_KEYS:
             if key not in config:
                 logger.error(f"缺少必需的配置项: {key}")
                 return False
@@ -150,7 +236,7 @@ class ConfigHandler:
         return self.config.copy()
 
 # 创建全局配置实例
-config_handler = ConfigHandler()
+config_handler = ConfigHandler.get()
 
 # 向后兼容的函数接口
 def save_config(file_path: str, config_dict: Dict[str, Any]) -> bool:
@@ -5,8 +5,10 @@
 import unittest
 import tempfile
 import os
+import json
 import numpy as np
 from pathlib import Path
+from unittest import mock
 
 # 添加项目根目录到Python路径
 import sys
@@ -14,6 +16,8 @@ sys.path.append(str(Path(__file__).parent))
 
 from config.config_handler import ConfigHandler, DEFAULT_RADIO_CONFIG
 from signal_process.signal_processor import SignalProcessor, SignalData
+from signal_process import kernels
+from signal_process import signal_processor_backup
 
 class TestConfigHandler(unittest.TestCase):
     """配置处理器测试"""
@@ -22,7 +26,7 @@ class TestConfigHandler(unittest.TestCase):
         """测试前准备"""
         self.temp_dir = tempfile.mkdtemp()
         self.config_file = os.path.join(self.temp_dir, "test_config.json")
-        self.config_handler = ConfigHandler(self.config_file)
+        self.config_handler = ConfigHandler.get(self.config_file)
     
     def tearDown(self):
         """测试后清理"""
@@ -65,6 +69,32 @@ class TestConfigHandler(unittest.TestCase):
         
         result = self.config_handler.save_config(invalid_config)
         self.assertFalse(result)
+    
+    def test_load_config_after_file_change(self):
+        """测试配置文件修改后重新加载"""
+        test_config = {
+            "center_freq": 100e6,
+            "sample_rate": 1e6,
+            "gain": "manual",
+            "device_id": "test-device"
+        }
+        self.assertTrue(self.config_handler.save_config(test_config))
+        self.config_handler.load_config()["device_id"] = "modified"
+        self.assertEqual(self.config_handler.load_config()["device_id"], "test-device")
+        
+        # 绕过save_config直接修改文件
+        with open(self.config_file, "w", encoding="utf-8") as file:
+            json.dump(dict(test_config, device_id="external-device"), file)
+        
+        loaded_config = self.config_handler.load_config()
+        self.assertEqual(loaded_config["device_id"], "external-device")
+    
+    def test_get_shared_instance(self):
+        """测试按路径共享配置处理器实例"""
+        self.assertIs(ConfigHandler.get(self.config_file), self.config_handler)
+        
+        other_file = os.path.join(self.temp_dir, "other_config.json")
+        self.assertIsNot(ConfigHandler.get(other_file), self.config_handler)
 
 class TestSignalProcessor(unittest.TestCase):
     """信号处理器测试"""
@@ -73,7 +103,7 @@ class TestSignalProcessor(unittest.TestCase):
         """测试前准备"""
         self.temp_dir = tempfile.mkdtemp()
         self.config_file = os.path.join(self.temp_dir, "test_config.json")
-        self.config_handler = ConfigHandler(self.config_file)
+        self.config_handler = ConfigHandler.get(self.config_file)
         self.processor = SignalProcessor(self.config_handler)
     
     def tearDown(self):
@@ -115,7 +145,303 @@ class TestSignalProcessor(unittest.TestCase):
             loaded_data = self.processor.load_signal_data(file_path)
             self.assertIsNotNone(loaded_data)
             self.assertEqual(len(loaded_data.data), len(signal_data.data))
+    
+    def test_create_iq_array_from_components(self):
+        """测试从分离的I/Q数组创建IQ数组"""
+        i_data = np.arange(5, dtype=np.float64)
+        q_data = -np.arange(5, dtype=np.float64)
+        
+        iq_array = self.processor.create_iq_array((i_data, q_data))
+        self.assertEqual(iq_array.shape, (5, 2))
+        self.assertEqual(iq_array.dtype, np.float32)
+        np.testing.assert_array_equal(iq_array[:, 0], i_data)
+        np.testing.assert_array_equal(iq_array[:, 1], q_data)
+        
+        # I/Q分量按列连续存储
+        self.assertTrue(iq_array[:, 0].flags.c_contiguous)
+        self.assertTrue(iq_array[:, 1].flags.c_contiguous)
+    
+    def test_create_iq_array_keeps_samples_only(self):
+        """测试采样率不混入IQ数据，也不修改处理器状态"""
+        processor = SignalProcessor(sample_rate=2.4e6)
+        iq_array = processor.create_iq_array([[1.0, 2.0], [3.0, 4.0]], 1.2e6)
+        self.assertEqual(iq_array.shape, (2, 2))
+        self.assertEqual(processor.sample_rate, 2.4e6)
+        
+        result = processor.process_iq_data(iq_array)
+        self.assertEqual(len(result['original_i']), 2)
+        self.assertNotIn('sample_rate', result)
+    
+    def test_process_readonly_iq_array(self):
+        """测试处理只读IQ数组（如内存映射加载的数据）"""
+        iq_array = self.processor.create_iq_array(
+            np.random.default_rng(0).standard_normal((100, 2)))
+        iq_array.flags.writeable = False
+        
+        result = self.processor.process_iq_data(iq_array)
+        i_components = iq_array[:, 0]
+        np.testing.assert_array_equal(
+            result['filtered_i'], np.where(i_components > result['i_mean'], 0, i_components))
+    
+    def test_create_iq_array_reuses_array(self):
+        """测试已符合要求的数组不被复制"""
+        iq_data = np.ones((100, 2), dtype=np.float32, order='F')
+        self.assertIs(self.processor.create_iq_array(iq_data), iq_data)
+        
+        # 数据类型不一致时仍需转换
+        iq_array = self.processor.create_iq_array(iq_data.astype(np.float64))
+        self.assertEqual(iq_array.dtype, np.float32)
+        self.assertTrue(iq_array.flags.f_contiguous)
+
+class TestSignalProcessorBackup(unittest.TestCase):
+    """信号处理器（采集与存储）测试"""
+    
+    def setUp(self):
+        """测试前准备"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.temp_dir, "test_config.json")
+        self.config_handler = ConfigHandler.get(self.config_file)
+        self.processor = signal_processor_backup.SignalProcessor(self.config_handler)
+    
+    def tearDown(self):
+        """测试后清理"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+    
+    def _make_signal_data(self, data):
+        """构造测试用的信号数据对象"""
+        return signal_processor_backup.SignalData(
+            data=data,
+            sample_rate=2.4e6,
+            center_freq=98.7e6,
+            timestamp=1.0,
+            metadata={'device_id': '测试设备'}
+        )
+    
+    def test_load_signal_data_memmap(self):
+        """测试未压缩文件以内存映射方式加载"""
+        signal_data = self.processor.process_signal(duration=0.01)
+        file_path = os.path.join(self.temp_dir, "signal.npz")
+        self.assertTrue(self.processor.save_signal_data(signal_data, file_path))
+        
+        loaded_data = self.processor.load_signal_data(file_path)
+        self.assertIsInstance(loaded_data.data, np.memmap)
+        self.assertEqual(loaded_data.data.dtype, signal_data.data.dtype)
+        np.testing.assert_array_equal(loaded_data.data, signal_data.data)
+        self.assertEqual(loaded_data.metadata, signal_data.metadata)
+        self.assertEqual(loaded_data.sample_rate, signal_data.sample_rate)
+    
+    def test_load_compressed_signal_data(self):
+        """测试压缩文件回退到常规读取"""
+        data = np.arange(100, dtype=np.float32).view(np.complex64)
+        file_path = os.path.join(self.temp_dir, "compressed.npz")
+        np.savez_compressed(file_path, data=data, sample_rate=2.4e6, center_freq=98.7e6,
+                            timestamp=1.0, metadata=json.dumps({}))
+        
+        loaded_data = self.processor.load_signal_data(file_path)
+        self.assertNotIsInstance(loaded_data.data, np.memmap)
+        np.testing.assert_array_equal(loaded_data.data, data)
+    
+    def test_load_empty_signal_data(self):
+        """测试空数组的保存和加载"""
+        signal_data = self._make_signal_data(np.empty(0, dtype=np.complex64))
+        file_path = os.path.join(self.temp_dir, "empty.npz")
+        self.assertTrue(self.processor.save_signal_data(signal_data, file_path))
+        
+        loaded_data = self.processor.load_signal_data(file_path)
+        self.assertEqual(loaded_data.data.shape, (0,))
+        self.assertEqual(loaded_data.data.dtype, np.complex64)
+
+    def test_continuous_batches_do_not_alias_pending_captures(self):
+        """测试连续采集时归还的缓冲区不会覆盖尚未写入的采集数据"""
+        self.assertTrue(self.processor.start_continuous_acquisition(self.temp_dir))
+        snapshots = []
+        file_paths = []
+        try:
+            for batch_index in range(3):
+                batch = []
+                for _ in range(2):
+                    signal_data = self.processor.process_signal(duration=0.001)
+                    for pending in batch:
+                        self.assertFalse(np.shares_memory(signal_data.data, pending.data))
+                    batch.append(signal_data)
+                snapshots.append([item.data.copy() for item in batch])
+                file_path = os.path.join(self.temp_dir, f"batch_{batch_index}.npz")
+                file_paths.append(file_path)
+                self.assertTrue(self.processor.save_signal_batch_async(batch, file_path))
+        finally:
+            self.assertTrue(self.processor.stop_continuous_acquisition())
+        
+        for file_path, expected in zip(file_paths, snapshots):
+            loaded_batch = self.processor.load_signal_batch(file_path)
+            self.assertEqual(len(loaded_batch), len(expected))
+            for loaded_data, data in zip(loaded_batch, expected):
+                np.testing.assert_array_equal(loaded_data.data, data)
+        
+        # 写入完成后缓冲区已归还到缓冲池，供后续采集复用
+        self.assertGreater(len(self.processor._buffer_pool), 0)
+        self.processor.is_running = True
+        pooled = list(self.processor._buffer_pool)
+        signal_data = self.processor.process_signal(duration=0.001)
+        self.processor.is_running = False
+        self.assertTrue(any(signal_data.data is buffer for buffer in pooled))
+    
+    def test_parallel_noise_generation(self):
+        """测试多线程分块生成随机数时填满整个缓冲区"""
+        out = np.full(4001, np.nan, dtype=np.float32)
+        with mock.patch.object(signal_processor_backup, 'RNG_THREADS', 4), \
+                mock.patch.object(signal_processor_backup, 'PARALLEL_RNG_MIN_SIZE', 1000):
+            self.assertIs(self.processor._fill_standard_normal(out), out)
+        
+        self.assertTrue(np.all(np.isfinite(out)))
+        self.assertEqual(len(self.processor._thread_rngs), 4)
+        # 各分块使用独立的随机数流
+        chunk_size = out.size // 4
+        self.assertFalse(np.array_equal(out[:chunk_size], out[chunk_size:2 * chunk_size]))
+    
+    def test_continuous_capture_reuses_scratch(self):
+        """测试连续采集时滤波工作缓冲区被复用，预处理失败时输出缓冲区被归还"""
+        self.processor.is_running = True
+        try:
+            self.processor.process_signal(duration=0.001)
+            scratch = self.processor._filter_scratch
+            self.processor.process_signal(duration=0.001)
+            self.assertIs(self.processor._filter_scratch, scratch)
+            
+            with mock.patch.object(signal_processor_backup, '_moving_average',
+                                   side_effect=RuntimeError("滤波失败")):
+                signal_data = self.processor.process_signal(duration=0.001)
+            self.assertFalse(np.shares_memory(signal_data.data, self.processor._acquisition_buffer))
+            self.assertEqual(len(self.processor._buffer_pool), 1)
+        finally:
+            self.processor.is_running = False
+    
+    def test_moving_average_matches_convolve(self):
+        """测试移动平均与 np.convolve(mode='same') 一致"""
+        rng = np.random.default_rng(0)
+        signal = (rng.standard_normal(1001) + 1j * rng.standard_normal(1001)).astype(np.complex64)
+        for window_size in (1, 7, 100):
+            expected = np.convolve(signal, np.ones(window_size) / window_size, mode='same')
+            result = signal_processor_backup._moving_average(signal, window_size)
+            self.assertEqual(result.dtype, np.complex64)
+            np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
+            
+            out = np.empty_like(signal)
+            self.assertIs(signal_processor_backup._moving_average(signal, window_size, out=out), out)
+            np.testing.assert_allclose(out, expected, rtol=1e-5, atol=1e-6)
+            
+            scratch = np.empty(len(signal) + 100, dtype=np.complex128)
+            result = signal_processor_backup._moving_average(signal, window_size, scratch=scratch)
+            np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
+
+    def test_fft_bin_frequency_matches_fftfreq(self):
+        """测试FFT频点频率与 np.fft.fftfreq 一致"""
+        sample_rate = 2.4e6
+        for num_samples in (8, 9, 1000, 1001):
+            expected = np.fft.fftfreq(num_samples, 1 / sample_rate)
+            for index in range(num_samples):
+                self.assertAlmostEqual(
+                    signal_processor_backup._fft_bin_frequency(index, num_samples, sample_rate),
+                    expected[index], places=6)
 
+class TestSignalKernels(unittest.TestCase):
+    """信号处理内核测试"""
+    
+    def setUp(self):
+        """测试前准备"""
+        rng = np.random.default_rng(0)
+        self.signal = (rng.standard_normal(1000)
+                       + 1j * rng.standard_normal(1000)).astype(np.complex64)
+    
+    def test_normalize_inplace(self):
+        """测试原地归一化"""
+        expected = self.signal / np.max(np.abs(self.signal))
+        result = kernels.normalize_inplace(self.signal)
+        
+        self.assertIs(result, self.signal)
+        self.assertEqual(result.dtype, np.complex64)
+        np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
+    
+    def test_peak_magnitude(self):
+        """测试峰值查找"""
+        magnitude = np.abs(self.signal)
+        peak_idx, peak = kernels.peak_magnitude(self.signal)
+        
+        self.assertEqual(peak_idx, np.argmax(magnitude))
+        self.assertAlmostEqual(peak, float(magnitude.max()), places=5)
+    
+    def test_peak_magnitude_multicore(self):
+        """测试多核时的分块并行查找与NumPy结果一致"""
+        magnitude = np.abs(self.signal)
+        with mock.patch.object(kernels, 'available_cpu_count', return_value=4):
+            peak_idx, peak = kernels.peak_magnitude(self.signal)
+        
+        self.assertEqual(peak_idx, np.argmax(magnitude))
+        self.assertAlmostEqual(peak, float(magnitude.max()), places=5)
+    
+    def test_zero_above(self):
+        """测试大于阈值的元素置零"""
+        values = self.signal.real.copy()
+        threshold = float(np.mean(values))
+        
+        result = kernels.zero_above(values, threshold)
+        np.testing.assert_array_equal(result, np.where(values > threshold, 0, values))
+        self.assertEqual(result.dtype, values.dtype)
+    
+    def test_non_finite_values(self):
+        """测试NaN的处理与NumPy一致"""
+        values = np.array([1.0, np.nan, 3.0], dtype=np.float32)
+        np.testing.assert_array_equal(kernels.zero_above(values, 2.0),
+                                      np.where(values > 2.0, 0, values))
+        
+        stats = kernels.iq_stats(values, np.ones(3, dtype=np.float32))
+        self.assertTrue(np.isnan(stats['i_max']))
+        self.assertTrue(np.isnan(stats['i_min']))
+        self.assertTrue(np.isnan(stats['i_mean']))
+        self.assertEqual(stats['q_mean'], 1.0)
+    
+    def test_zero_above_inplace(self):
+        """测试写入调用方提供的缓冲区"""
+        values = self.signal.real.copy()
+        threshold = float(np.mean(values))
+        expected = np.where(values > threshold, 0, values)
+        
+        result = kernels.zero_above(values, threshold, out=values)
+        self.assertIs(result, values)
+        np.testing.assert_array_equal(values, expected)
+        
+        with self.assertRaises(ValueError):
+            kernels.zero_above(values, threshold, out=np.empty(10, dtype=values.dtype))
+    
+    def test_iq_stats(self):
+        """测试I/Q统计信息"""
+        i_values = self.signal.real.copy()
+        q_values = self.signal.imag.copy()
+        
+        stats = kernels.iq_stats(i_values, q_values)
+        self.assertAlmostEqual(stats['i_mean'], float(np.mean(i_values)), places=5)
+        self.assertAlmostEqual(stats['i_std'], float(np.std(i_values)), places=5)
+        self.assertAlmostEqual(stats['q_mean'], float(np.mean(q_values)), places=5)
+        self.assertAlmostEqual(stats['q_std'], float(np.std(q_values)), places=5)
+        self.assertEqual(stats['i_max'], float(np.max(i_values)))
+        self.assertEqual(stats['i_min'], float(np.min(i_values)))
+    
+    def test_iq_stats_length_mismatch(self):
+        """测试I/Q分量长度不一致时报错"""
+        with self.assertRaises(ValueError):
+            kernels.iq_stats(np.ones(10, dtype=np.float32), np.ones(3, dtype=np.float32))
+    
+    def test_component_mean(self):
+        """测试单个分量的均值（含只读与非连续数组）"""
+        iq_array = np.asfortranarray(np.stack([self.signal.real, self.signal.imag], axis=1))
+        i_values = iq_array[:, 0]
+        i_values.flags.writeable = False
+        
+        self.assertAlmostEqual(kernels.component_mean(i_values),
+                               float(np.mean(i_values.astype(np.float64))), places=6)
+        self.assertAlmostEqual(kernels.component_mean(i_values[::2]),
+                               float(np.mean(i_values[::2])), places=5)
+        
 def run_tests():
     """运行所有测试"""
     unittest.main(verbosity=2)
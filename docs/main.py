@@ -4,6 +4,7 @@
 提供命令行接口进行信号采集和处理
 """
 import argparse
+import json
 import sys
 import logging
 from pathlib import Path
@@ -15,6 +16,16 @@ sys.path.append(str(Path(__file__).parent))
 from config.config_handler import ConfigHandler
 from signal_process.signal_processor import SignalProcessor
 
+# 优先使用orjson序列化分析结果，未安装时回退到标准库json
+try:
+    import orjson
+    
+    def dump_json(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def dump_json(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 # 配置日志
 logging.basicConfig(
     level=logging.INFO,
@@ -41,12 +52,14 @@ def main():
                        help='连续采集模式')
     parser.add_argument('--interval', '-i', type=float, default=5.0,
                        help='连续采集间隔（秒）')
+    parser.add_argument('--batch-size', '-b', type=int, default=4,
+                       help='连续采集时每个文件保存的采集次数')
     
     args = parser.parse_args()
     
     try:
         # 初始化配置处理器
-        config_handler = ConfigHandler(args.config)
+        config_handler = ConfigHandler.get(args.config)
         config = config_handler.load_config()
         
         logger.info("=== 无线电数据采集系统启动 ===")
@@ -64,7 +77,7 @@ def main():
         
         if args.continuous:
             # 连续采集模式
-            run_continuous_acquisition(processor, output_dir, args.interval)
+            run_continuous_acquisition(processor, output_dir, args.interval, args.batch_size)
         else:
             # 单次采集模式
             run_single_acquisition(processor, output_dir, args.duration, args.analyze)
@@ -108,24 +121,36 @@ def run_single_acquisition(processor, output_dir, duration, analyze):
             for key, value in analysis_result.items():
                 logger.info(f"{key}: {value}")
             
-            # 保存分析结果
-            analysis_file = output_dir / f"analysis_{timestamp}.txt"
-            with open(analysis_file, 'w', encoding='utf-8') as f:
-                f.write("=== 信号分析结果 ===\n")
-                f.write(f"时间戳: {timestamp}\n")
-                f.write(f"中心频率: {signal_data.center_freq} Hz\n")
-                f.write(f"采样率: {signal_data.sample_rate} Hz\n")
-                f.write(f"数据长度: {len(signal_data.data)}\n\n")
-                
-                for key, value in analysis_result.items():
-                    f.write(f"{key}: {value}\n")
+            # 保存分析结果（序列化为JSON后一次性写入）
+            analysis_file = output_dir / f"analysis_{timestamp}.json"
+            payload = {
+                'timestamp': timestamp,
+                'center_freq': signal_data.center_freq,
+                'sample_rate': signal_data.sample_rate,
+                **analysis_result
+            }
+            analysis_file.write_bytes(dump_json(payload))
             
             logger.info(f"分析结果已保存到: {analysis_file}")
 
-def run_continuous_acquisition(processor, output_dir, interval):
+def save_continuous_batch(processor, output_dir, batch, first_count):
+    """将一批连续采集数据提交保存"""
+    timestamp = int(batch[0].timestamp)
+    filename = f"continuous_{first_count:04d}_{timestamp}.npz"
+    filepath = output_dir / filename
+    
+    # 提交到后台写入线程，不阻塞下一次采集
+    if processor.save_signal_batch_async(batch, str(filepath)):
+        logger.info(f"{len(batch)} 次采集数据已提交保存: {filename}")
+    else:
+        logger.error(f"数据保存失败: {filename}")
+
+def run_continuous_acquisition(processor, output_dir, interval, batch_size=4):
     """运行连续信号采集"""
-    logger.info(f"开始连续信号采集，间隔: {interval} 秒")
+    logger.info(f"开始连续信号采集，间隔: {interval} 秒，每个文件 {batch_size} 次采集")
     
+    batch = []
+    first_count = 1
     try:
         processor.start_continuous_acquisition(str(output_dir))
         
@@ -138,15 +163,14 @@ def run_continuous_acquisition(processor, output_dir, interval):
             signal_data = processor.process_signal(duration=1.0)
             
             if signal_data:
-                # 保存数据
-                timestamp = int(signal_data.timestamp)
-                filename = f"continuous_{count:04d}_{timestamp}.npz"
-                filepath = output_dir / filename
+                if not batch:
+                    first_count = count
+                batch.append(signal_data)
                 
-                if processor.save_signal_data(signal_data, str(filepath)):
-                    logger.info(f"数据已保存: {filename}")
-                else:
-                    logger.error(f"数据保存失败: {filename}")
+                # 凑满一批后写入同一个文件
+                if len(batch) >= batch_size:
+                    save_continuous_batch(processor, output_dir, batch, first_count)
+                    batch = []
             
             # 等待下次采集
             time.sleep(interval)
@@ -154,6 +178,9 @@ def run_continuous_acquisition(processor, output_dir, interval):
     except KeyboardInterrupt:
         logger.info("用户中断连续采集")
     finally:
+        # 保存不足一批的剩余数据
+        if batch:
+            save_continuous_batch(processor, output_dir, batch, first_count)
         processor.stop_continuous_acquisition()
 
 if __name__ == "__main__":
@@ -0,0 +1,107 @@
+"""
+信号处理计算内核的Numba实现
+由 kernels 模块在首次需要时导入，导入本模块即完成内核的编译（或从磁盘缓存加载）
+"""
+import math
+
+import numpy as np
+from numba import njit, prange, types
+
+from .kernels import _CHUNK_SIZE
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def normalize_inplace(signal):
+    # 第一遍：求最大模平方（无需开方，单调性不变）
+    peak_sq = 0.0
+    for i in prange(signal.size):
+        value = signal[i]
+        peak_sq = max(peak_sq, value.real * value.real + value.imag * value.imag)
+
+    if peak_sq > 0.0:
+        # 第二遍：原地缩放
+        scale = 1.0 / math.sqrt(peak_sq)
+        for i in prange(signal.size):
+            signal[i] *= scale
+    return signal
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def argmax_power(data):
+    # 各分块并行求局部最大模平方，再合并为全局结果
+    num_chunks = (data.size + _CHUNK_SIZE - 1) // _CHUNK_SIZE
+    chunk_idx = np.empty(num_chunks, dtype=np.int64)
+    chunk_peak = np.empty(num_chunks, dtype=np.float64)
+    for chunk in prange(num_chunks):
+        start = chunk * _CHUNK_SIZE
+        stop = min(start + _CHUNK_SIZE, data.size)
+        best_idx = start
+        best_peak = -1.0
+        for i in range(start, stop):
+            value = data[i]
+            power = value.real * value.real + value.imag * value.imag
+            if power > best_peak:
+                best_peak = power
+                best_idx = i
+        chunk_idx[chunk] = best_idx
+        chunk_peak[chunk] = best_peak
+
+    best_chunk = np.argmax(chunk_peak)
+    return chunk_idx[best_chunk], chunk_peak[best_chunk]
+
+
+# 显式给出签名，在导入本模块时完成编译（配合cache从磁盘加载），首次调用无需等待JIT；
+# 输入按只读数组声明，可写数组与只读数组（如内存映射或 np.frombuffer 的结果）
+# 共用同一份代码；结果写入调用方提供的缓冲区（可与输入为同一数组）。
+# 释放GIL以便多个线程同时调用，因此采用串行循环：parallel内核在workqueue
+# 线程层下不支持并发调用
+ZERO_ABOVE_SIGNATURES = [
+    types.void(types.Array(dtype, 1, 'A', readonly=True), types.float64,
+               types.Array(dtype, 1, 'A'))
+    for dtype in (types.float32, types.float64)
+]
+
+
+# 不启用fastmath：比较选择无从加速，且需保持NaN不被置零的语义
+@njit(ZERO_ABOVE_SIGNATURES, nogil=True, cache=True)
+def zero_above(values, threshold, out):
+    # 单遍比较并选择，不生成布尔掩码
+    for i in range(values.size):
+        value = values[i]
+        out[i] = 0 if value > threshold else value
+
+
+# 显式签名编译为单位步长的float32循环，仅允许重排加法以便LLVM向量化；
+# 累加器使用float64，避免长序列求和的精度损失
+@njit(types.float64(types.Array(types.float32, 1, 'C', readonly=True)),
+      fastmath={'reassoc'}, cache=True)
+def mean_f32(values):
+    total = 0.0
+    for i in range(values.shape[0]):
+        total += values[i]
+    return total / values.shape[0]
+
+
+# 不启用fastmath，使含NaN的输入在累加和中如实传播
+@njit(parallel=True, cache=True)
+def iq_moments(i_values, q_values):
+    # 以首元素为偏移量累加，减小平方和相减时的精度损失
+    i_shift = np.float64(i_values[0])
+    q_shift = np.float64(q_values[0])
+    i_sum = 0.0
+    i_sum_sq = 0.0
+    q_sum = 0.0
+    q_sum_sq = 0.0
+    i_min = i_values[0]
+    i_max = i_values[0]
+    for k in prange(i_values.size):
+        i_value = i_values[k]
+        i_delta = i_value - i_shift
+        q_delta = q_values[k] - q_shift
+        i_sum += i_delta
+        i_sum_sq += i_delta * i_delta
+        q_sum += q_delta
+        q_sum_sq += q_delta * q_delta
+        i_min = min(i_min, i_value)
+        i_max = max(i_max, i_value)
+    return i_shift, i_sum, i_sum_sq, q_shift, q_sum, q_sum_sq, i_min, i_max
@@ -0,0 +1,186 @@
+"""
+信号处理计算内核
+提供热点运算的Numba加速实现，未安装Numba时回退到NumPy实现
+
+Numba内核位于 _numba_kernels 模块，首次调用时才导入并编译（或从磁盘缓存加载），
+导入本模块不会加载Numba
+"""
+import functools
+import math
+import os
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# 并行归约时每个分块的样本数
+_CHUNK_SIZE = 1 << 16
+
+
+def available_cpu_count() -> int:
+    """当前进程实际可用的CPU核心数（考虑CPU亲和性设置）"""
+    if hasattr(os, 'process_cpu_count'):
+        return os.process_cpu_count() or 1
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernels():
+    """导入Numba内核模块，未安装Numba时返回None"""
+    try:
+        from . import _numba_kernels as numba_kernels
+    except ImportError:
+        return None
+    return numba_kernels
+
+
+def normalize_inplace(signal: np.ndarray) -> np.ndarray:
+    """
+    按峰值幅度原地归一化复数信号
+
+    Args:
+        signal: 复数信号（一维，会被原地修改）
+
+    Returns:
+        np.ndarray: 归一化后的信号（与输入为同一数组）
+    """
+    numba_kernels = _numba_kernels()
+    if numba_kernels is not None:
+        return numba_kernels.normalize_inplace(signal)
+
+    # 分块计算模平方的最大值：不做开方，临时数组大小固定为一个分块
+    peak_sq = 0.0
+    block_size = min(_CHUNK_SIZE, signal.size)
+    power = np.empty(block_size, dtype=signal.real.dtype)
+    imag_sq = np.empty(block_size, dtype=signal.real.dtype)
+    for start in range(0, signal.size, _CHUNK_SIZE):
+        block = signal[start:start + _CHUNK_SIZE]
+        block_power = power[:block.size]
+        np.multiply(block.real, block.real, out=block_power)
+        block_power += np.multiply(block.imag, block.imag, out=imag_sq[:block.size])
+        peak_sq = max(peak_sq, float(block_power.max()))
+
+    if peak_sq > 0:
+        signal *= 1.0 / math.sqrt(peak_sq)
+    return signal
+
+
+def peak_magnitude(data: np.ndarray) -> Tuple[int, float]:
+    """
+    查找复数数组中模值最大的元素
+
+    Args:
+        data: 复数数组（一维，如FFT结果）
+
+    Returns:
+        Tuple[int, float]: 最大值的下标及其模值
+    """
+    # 分块并行查找只有多核时才有收益，单核时 np.abs + argmax 更快
+    numba_kernels = _numba_kernels() if available_cpu_count() > 1 else None
+    if numba_kernels is not None and data.size:
+        peak_idx, peak_power = numba_kernels.argmax_power(data)
+        return int(peak_idx), math.sqrt(peak_power)
+
+    magnitude = np.abs(data)
+    peak_idx = int(np.argmax(magnitude))
+    return peak_idx, float(magnitude[peak_idx])
+
+
+def zero_above(values: np.ndarray, threshold: float,
+               out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    将大于阈值的元素置零，等价于 np.where(values > threshold, 0, values)
+
+    Args:
+        values: 实数数组（一维）
+        threshold: 阈值
+        out: 可选的输出缓冲区，形状和数据类型须与输入一致；
+             传入 values 本身时原地滤波，不分配新数组
+
+    Returns:
+        np.ndarray: 滤波结果（未提供out时为新数组），数据类型与输入一致
+    """
+    if out is None:
+        out = np.empty_like(values)
+    elif out.shape != values.shape or out.dtype != values.dtype:
+        raise ValueError("输出缓冲区的形状和数据类型必须与输入一致")
+
+    if values.dtype in (np.float32, np.float64) and values.ndim == 1:
+        numba_kernels = _numba_kernels()
+        if numba_kernels is not None:
+            numba_kernels.zero_above(values, threshold, out)
+            return out
+
+    if out is not values:
+        np.copyto(out, values)
+    np.putmask(out, out > threshold, 0)
+    return out
+
+
+def component_mean(values: np.ndarray) -> float:
+    """
+    计算单个分量（一维实数数组）的均值
+
+    Args:
+        values: 实数数组（一维）
+
+    Returns:
+        float: 均值；连续存储的float32数组走Numba单遍归约（float64累加）
+    """
+    if values.dtype == np.float32 and values.ndim == 1 and values.flags.c_contiguous and values.size:
+        numba_kernels = _numba_kernels()
+        if numba_kernels is not None:
+            return float(numba_kernels.mean_f32(values))
+    return float(np.mean(values))
+
+
+def _shifted_mean_std(shift: float, total: float, total_sq: float, count: int) -> Tuple[float, float]:
+    """由偏移累加和计算均值与总体标准差"""
+    mean_delta = total / count
+    variance = max(total_sq / count - mean_delta * mean_delta, 0.0)
+    return shift + mean_delta, math.sqrt(variance)
+
+
+def iq_stats(i_values: np.ndarray, q_values: np.ndarray) -> Dict[str, float]:
+    """
+    计算I/Q分量的统计信息
+
+    Numba可用时单遍完成全部统计，否则（或数据含NaN/Inf时）逐项调用NumPy
+
+    Args:
+        i_values: I分量（一维）
+        q_values: Q分量（一维，长度与I分量一致）
+
+    Returns:
+        Dict[str, float]: 包含 i_mean、i_std、q_mean、q_std、i_max、i_min
+    """
+    if i_values.shape != q_values.shape:
+        raise ValueError("I/Q分量的形状必须一致")
+
+    numba_kernels = _numba_kernels()
+    if numba_kernels is not None and i_values.size:
+        (i_shift, i_sum, i_sum_sq, q_shift, q_sum, q_sum_sq,
+         i_min, i_max) = numba_kernels.iq_moments(i_values, q_values)
+        # 含NaN/Inf时逐元素比较得到的最值与NumPy不一致，交由下方NumPy实现处理
+        if math.isfinite(i_sum) and math.isfinite(q_sum):
+            count = i_values.size
+            i_mean, i_std = _shifted_mean_std(i_shift, i_sum, i_sum_sq, count)
+            q_mean, q_std = _shifted_mean_std(q_shift, q_sum, q_sum_sq, count)
+            return {
+                'i_mean': i_mean,
+                'i_std': i_std,
+                'q_mean': q_mean,
+                'q_std': q_std,
+                'i_max': float(i_max),
+                'i_min': float(i_min)
+            }
+
+    return {
+        'i_mean': float(np.mean(i_values)),
+        'i_std': float(np.std(i_values)),
+        'q_mean': float(np.mean(q_values)),
+        'q_std': float(np.std(q_values)),
+        'i_max': float(np.max(i_values)),
+        'i_min': float(np.min(i_values))
+    }
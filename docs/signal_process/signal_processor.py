@@ -5,11 +5,19 @@
 
 import numpy as np
 import logging
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Union
 from dataclasses import dataclass
+import sys
 import time
 from pathlib import Path
 
+try:
+    from .kernels import iq_stats, zero_above
+except ImportError:
+    # 直接运行本文件时，将项目目录加入路径后按包名导入
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    from signal_process.kernels import iq_stats, zero_above
+
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -31,34 +39,42 @@ class SignalProcessor:
         self.center_freq = center_freq
         self.history = []
     
-    def create_iq_array(self, iq_data_list: Optional[List] = None, 
+    def create_iq_array(self, iq_data_list: Optional[Union[List, Tuple[np.ndarray, np.ndarray]]] = None, 
                        sample_rate: Optional[float] = None) -> np.ndarray:
         """
         创建IQ信号数组
         
         参数:
-            iq_data_list: IQ数据列表，如 [[I1, Q1], [I2, Q2], ...]
-            sample_rate: 采样率
+            iq_data_list: IQ数据列表，如 [[I1, Q1], [I2, Q2], ...]，
+                          或 (I数组, Q数组) 形式的NumPy数组元组
+            sample_rate: 采样率（仅为兼容原有调用方式保留）；不再作为标注行
+                         追加到数组末尾，由调用方与数组分开保存
             
         返回:
-            IQ信号数组
+            IQ信号数组，形状为 (n, 2)，按列存储（I、Q分量各自连续）；
+            输入已是按列存储的float32数组时直接返回该数组，不做复制
         """
+        # 按列（Fortran顺序）存储：iq_array[:, 0] 与 iq_array[:, 1] 均为连续内存，
+        # 后续对I/Q分量的归约和滤波都是单位步长访问
         if iq_data_list is None:
             # 创建空的IQ数据
-            iq_array = np.zeros((1000, 2), dtype=np.float32)
+            iq_array = np.zeros((1000, 2), dtype=np.float32, order='F')
             logger.info("创建了空的IQ数组: %s", iq_array.shape)
+        elif (isinstance(iq_data_list, tuple) and len(iq_data_list) == 2
+              and all(isinstance(part, np.ndarray) for part in iq_data_list)):
+            # 分离的I/Q数组：直接按列写入，无需逐元素解析Python列表
+            i_data, q_data = iq_data_list
+            if len(i_data) != len(q_data):
+                raise ValueError("I/Q数组长度必须一致")
+            iq_array = np.empty((len(i_data), 2), dtype=np.float32, order='F')
+            iq_array[:, 0] = i_data
+            iq_array[:, 1] = q_data
+            logger.info("从I/Q数组创建IQ数组: %s", iq_array.shape)
         else:
-            # 转换为NumPy数组
-            iq_array = np.array(iq_data_list, dtype=np.float32)
+            # 转换为NumPy数组；输入已是按列存储的float32数组时直接复用，不再复制
+            iq_array = np.asarray(iq_data_list, dtype=np.float32, order='F')
             logger.info("从列表创建IQ数组: %s", iq_array.shape)
         
-        # 添加采样率标注
-        if sample_rate is not None:
-            # 在数组末尾添加一行标注信息
-            info_row = np.array([[sample_rate, 0]], dtype=np.float32)
-            iq_array = np.vstack([iq_array, info_row])
-            logger.info("添加采样率标注: %s Hz", sample_rate)
-        
         return iq_array
     
     def process_iq_data(self, iq_array: np.ndarray) -> dict:
@@ -77,40 +93,27 @@ class SignalProcessor:
         if len(iq_array.shape) != 2 or iq_array.shape[1] != 2:
             raise ValueError("IQ数组必须是二维数组，形状为 (n, 2)")
         
-        print(f"数组维度: {iq_array.shape}")
-        print(f"数据类型: {iq_array.dtype}")
+        # 调试输出使用延迟格式化，未开启DEBUG级别时不生成字符串
+        logger.debug("数组维度: %s", iq_array.shape)
+        logger.debug("数据类型: %s", iq_array.dtype)
         
         # 提取前200组信号
         first_200 = iq_array[:200]
-        print(f"前200组信号形状: {first_200.shape}")
+        logger.debug("前200组信号形状: %s", first_200.shape)
         
-        # 提取所有Q分量（排除最后一行标注）
-        if iq_array.shape[0] > 1 and np.all(iq_array[-1, :] == [iq_array[-1, 0], 0]):
-            # 最后一行是标注信息
-            q_components = iq_array[:-1, 1]
-            i_components = iq_array[:-1, 0]
-        else:
-            q_components = iq_array[:, 1]
-            i_components = iq_array[:, 0]
+        # 提取所有I/Q分量
+        q_components = iq_array[:, 1]
+        i_components = iq_array[:, 0]
         
-        print(f"Q分量数量: {len(q_components)}")
+        logger.debug("Q分量数量: %d", len(q_components))
         
-        # 计算I分量均值
-        i_mean = np.mean(i_components)
-        print(f"I分量均值: {i_mean}")
+        # 计算统计信息（含I分量均值）
+        stats = iq_stats(i_components, q_components)
+        i_mean = stats['i_mean']
+        logger.debug("I分量均值: %s", i_mean)
         
         # 滤波处理：将大于均值的I分量设为0
-        filtered_i = np.where(i_components > i_mean, 0, i_components)
-        
-        # 计算统计信息
-        stats = {
-            'i_mean': i_mean,
-            'i_std': np.std(i_components),
-            'q_mean': np.mean(q_components),
-            'q_std': np.std(q_components),
-            'i_max': np.max(i_components),
-            'i_min': np.min(i_components)
-        }
+        filtered_i = zero_above(i_components, i_mean)
         
         logger.info("IQ数据处理完成，I分量均值: %.6f", i_mean)
         
@@ -3,16 +3,67 @@
 负责无线电信号的采集、处理和存储
 """
 import numpy as np
+import json
 import logging
-from typing import Optional, Tuple, List
+import struct
+import zipfile
+from typing import TYPE_CHECKING, Optional, Tuple, List
 from dataclasses import dataclass
+import sys
 import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from config.config_handler import ConfigHandler
+
+try:
+    from .kernels import available_cpu_count, normalize_inplace, peak_magnitude
+except ImportError:
+    # 直接运行本文件时，将项目目录加入路径后按包名导入
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    from signal_process.kernels import available_cpu_count, normalize_inplace, peak_magnitude
+
+# 优先使用scipy.fft（多线程、保留单精度），未安装时回退到numpy.fft
+try:
+    from scipy import fft as fft_backend
+    FFT_OPTIONS = {'workers': -1}
+except ImportError:
+    fft_backend = np.fft
+    FFT_OPTIONS = {}
+
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 连续采集时写入队列的最大积压数量，队列满时采集线程等待写入完成
+WRITE_QUEUE_SIZE = 8
+
+# 连续采集时可复用的输出缓冲区数量
+BUFFER_POOL_SIZE = 4
+
+# 预处理移动平均滤波的最大窗口长度
+FILTER_WINDOW_SIZE = 100
+
+# 模拟采集时并行生成随机数的线程数，以及启用并行生成的最少随机数个数
+RNG_THREADS = available_cpu_count()
+PARALLEL_RNG_MIN_SIZE = 1 << 20
+
+# 所有处理器实例共用的随机数生成线程池，首次并行生成时创建
+_rng_executor: Optional[ThreadPoolExecutor] = None
+_rng_executor_lock = threading.Lock()
+
+def _get_rng_executor() -> ThreadPoolExecutor:
+    """获取共用的随机数生成线程池"""
+    global _rng_executor
+    with _rng_executor_lock:
+        if _rng_executor is None:
+            _rng_executor = ThreadPoolExecutor(max_workers=RNG_THREADS,
+                                               thread_name_prefix='signal-rng')
+        return _rng_executor
+
 @dataclass
 class SignalData:
     """信号数据结构"""
@@ -22,24 +73,138 @@ class SignalData:
     timestamp: float
     metadata: dict
 
+def _moving_average(signal: np.ndarray, window_size: int,
+                    out: Optional[np.ndarray] = None,
+                    scratch: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    移动平均滤波，结果与 np.convolve(signal, ones/window_size, mode='same') 一致
+    
+    使用累积和实现，复杂度为 O(N)，与窗口长度无关
+    
+    Args:
+        signal: 输入信号
+        window_size: 窗口长度
+        out: 可选的输出缓冲区，长度须与输入一致
+        scratch: 可选的complex128工作缓冲区，长度不小于 len(signal) + window_size，
+                 用于存放补零后的累积和，避免每次调用重新分配
+    
+    Returns:
+        np.ndarray: 滤波后的信号，数据类型与输入一致（指定out时为out）
+    """
+    # 两端补零以对齐 mode='same' 的输出位置；中间部分随即被信号覆盖，只需清零两端
+    start = window_size // 2 + 1
+    stop = start + len(signal)
+    padded_size = len(signal) + window_size
+    if scratch is not None and len(scratch) >= padded_size:
+        padded = scratch[:padded_size]
+    else:
+        padded = np.empty(padded_size, dtype=np.complex128)
+    padded[:start] = 0
+    padded[start:stop] = signal
+    padded[stop:] = 0
+
+    # 使用双精度累加，避免长信号累积和的精度损失
+    csum = np.cumsum(padded, out=padded)
+    if out is not None:
+        np.subtract(csum[window_size:], csum[:-window_size], out=out)
+        out /= window_size
+        return out
+
+    averaged = csum[window_size:] - csum[:-window_size]
+    averaged /= window_size
+
+    return averaged.astype(np.result_type(signal.dtype, np.complex64), copy=False)
+
+def _fft_bin_frequency(index: int, num_samples: int, sample_rate: float) -> float:
+    """
+    计算FFT第index个频点对应的频率，与 np.fft.fftfreq(num_samples, 1/sample_rate)[index] 一致
+    
+    Args:
+        index: 频点下标
+        num_samples: FFT长度
+        sample_rate: 采样率
+        
+    Returns:
+        float: 频率（Hz），后半部分为负频率
+    """
+    if index >= (num_samples + 1) // 2:
+        index -= num_samples
+    return index * sample_rate / num_samples
+
+def _memmap_npz_member(file_path: str, member: str) -> Optional[np.ndarray]:
+    """
+    以内存映射方式打开未压缩.npz文件中的数组成员
+    
+    Args:
+        file_path: .npz文件路径
+        member: 成员文件名（如 'data.npy'）
+        
+    Returns:
+        np.ndarray: 只读的内存映射数组；成员被压缩或格式不支持时返回None
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        info = archive.getinfo(member)
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    
+    with open(file_path, 'rb') as file:
+        # 跳过ZIP本地文件头：30字节固定部分 + 文件名 + 扩展字段
+        file.seek(info.header_offset)
+        name_length, extra_length = struct.unpack('<HH', file.read(30)[26:30])
+        file.seek(info.header_offset + 30 + name_length + extra_length)
+        
+        # 解析.npy头部，得到数组数据在文件中的起始位置
+        version = np.lib.format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+        else:
+            return None
+        offset = file.tell()
+    
+    if dtype.hasobject or 0 in shape:
+        return None
+    
+    return np.memmap(file_path, dtype=dtype, mode='r', shape=shape,
+                     order='F' if fortran_order else 'C', offset=offset)
+
 class SignalProcessor:
     """信号处理器类"""
     
-    def __init__(self, config_handler):
+    def __init__(self, config_handler: Optional['ConfigHandler'] = None):
         """
         初始化信号处理器
         
         Args:
-            config_handler: 配置处理器实例
+            config_handler: 配置处理器实例，为None时使用默认配置文件的共享实例
         """
+        if config_handler is None:
+            # 仅在需要默认配置时导入，信号处理模块本身不依赖config包
+            from config.config_handler import ConfigHandler
+            config_handler = ConfigHandler.get()
         self.config_handler = config_handler
         self.config = config_handler.get_config()
         self.is_running = False
+        # 模拟采集使用的随机数生成器（SFC64比传统MT19937更快）
+        self._rng = np.random.default_rng(np.random.SFC64())
+        # 并行生成随机数时每个分块独立的生成器，首次需要时创建
+        self._thread_rngs: List[np.random.Generator] = []
+        self._write_queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        # 连续采集时复用的缓冲区：原始采集缓冲区和滤波工作缓冲区在预处理后即可复用，
+        # 输出缓冲区在后台写入完成后归还到缓冲池
+        self._acquisition_buffer: Optional[np.ndarray] = None
+        self._filter_scratch: Optional[np.ndarray] = None
+        self._buffer_pool: List[np.ndarray] = []
+        self._pool_lock = threading.Lock()
         
     def process_signal(self, duration: float = 1.0) -> Optional[SignalData]:
         """
         处理信号数据
         
+        连续采集模式下复用预分配的缓冲区，避免每次采集重新分配内存
+        
         Args:
             duration: 信号采集时长（秒）
             
@@ -50,15 +215,35 @@ class SignalProcessor:
             logger.info(f"开始处理信号，中心频率：{self.config['center_freq']} Hz")
             logger.info(f"采样率：{self.config['sample_rate']} Hz")
             
+            acquisition_buffer = None
+            output_buffer = None
+            filter_scratch = None
+            if self.is_running:
+                num_samples = int(self.config['sample_rate'] * duration)
+                if self._acquisition_buffer is None or len(self._acquisition_buffer) != num_samples:
+                    self._acquisition_buffer = np.empty(num_samples, dtype=np.complex64)
+                    self._filter_scratch = np.empty(num_samples + FILTER_WINDOW_SIZE,
+                                                    dtype=np.complex128)
+                acquisition_buffer = self._acquisition_buffer
+                filter_scratch = self._filter_scratch
+                output_buffer = self._acquire_output_buffer(num_samples)
+            
             # 模拟信号采集（实际项目中这里会连接真实的硬件）
-            signal_data = self._simulate_signal_acquisition(duration)
+            signal_data = self._simulate_signal_acquisition(duration, out=acquisition_buffer)
             
             if signal_data is None:
                 logger.error("信号采集失败")
+                self._release_unused_buffer(output_buffer)
                 return None
             
             # 信号预处理
-            processed_data = self._preprocess_signal(signal_data)
+            processed_data = self._preprocess_signal(signal_data, out=output_buffer,
+                                                     scratch=filter_scratch)
+            if processed_data is acquisition_buffer:
+                # 预处理失败时返回的是原始缓冲区，复制一份以免下次采集覆盖；
+                # 未被使用的输出缓冲区归还到缓冲池
+                processed_data = processed_data.copy()
+                self._release_unused_buffer(output_buffer)
             
             # 创建信号数据对象
             signal_obj = SignalData(
@@ -81,12 +266,34 @@ class SignalProcessor:
             logger.error(f"信号处理失败: {e}")
             return None
     
-    def _simulate_signal_acquisition(self, duration: float) -> Optional[np.ndarray]:
+    def _acquire_output_buffer(self, num_samples: int) -> np.ndarray:
+        """从缓冲池取出一个长度匹配的输出缓冲区，池中没有时新分配"""
+        with self._pool_lock:
+            while self._buffer_pool:
+                buffer = self._buffer_pool.pop()
+                if len(buffer) == num_samples:
+                    return buffer
+        return np.empty(num_samples, dtype=np.complex64)
+    
+    def _release_output_buffer(self, buffer: np.ndarray):
+        """将不再使用的输出缓冲区归还到缓冲池"""
+        with self._pool_lock:
+            if len(self._buffer_pool) < BUFFER_POOL_SIZE:
+                self._buffer_pool.append(buffer)
+    
+    def _release_unused_buffer(self, buffer: Optional[np.ndarray]):
+        """采集失败时归还已取出但未使用的输出缓冲区"""
+        if buffer is not None:
+            self._release_output_buffer(buffer)
+    
+    def _simulate_signal_acquisition(self, duration: float,
+                                     out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
         模拟信号采集（实际项目中替换为真实硬件接口）
         
         Args:
             duration: 采集时长
+            out: 可选的complex64缓冲区，长度与样本数一致时直接写入
             
         Returns:
             np.ndarray: 采集的信号数据
@@ -97,9 +304,14 @@ class SignalProcessor:
             
             # 生成模拟的复数信号数据
             # 实际项目中这里会调用RTL-SDR或其他硬件接口
-            real_part = np.random.normal(0, 0.1, num_samples)
-            imag_part = np.random.normal(0, 0.1, num_samples)
-            signal = real_part + 1j * imag_part
+            # 直接以complex64生成，I/Q分量交错写入同一块缓冲区
+            if out is not None and len(out) == num_samples:
+                signal = out
+            else:
+                signal = np.empty(num_samples, dtype=np.complex64)
+            iq_view = signal.view(np.float32)
+            self._fill_standard_normal(iq_view)
+            np.multiply(iq_view, 0.1, out=iq_view)
             
             logger.info(f"模拟采集了 {num_samples} 个样本")
             return signal
@@ -108,26 +320,63 @@ class SignalProcessor:
             logger.error(f"信号采集模拟失败: {e}")
             return None
     
-    def _preprocess_signal(self, signal: np.ndarray) -> np.ndarray:
+    def _fill_standard_normal(self, out: np.ndarray) -> np.ndarray:
+        """
+        用标准正态随机数填充一维float32缓冲区
+        
+        数据量较大且有多个CPU核心时，按线程数分块，在共用线程池中并行生成：
+        每个分块使用由SeedSequence派生的独立随机数流，NumPy生成随机数时释放GIL
+        
+        Args:
+            out: 待填充的缓冲区（一维、连续的float32数组）
+            
+        Returns:
+            np.ndarray: 填充后的缓冲区（即out）
+        """
+        if RNG_THREADS <= 1 or out.size < PARALLEL_RNG_MIN_SIZE:
+            return self._rng.standard_normal(dtype=np.float32, out=out)
+        
+        if len(self._thread_rngs) != RNG_THREADS:
+            self._thread_rngs = [np.random.Generator(np.random.SFC64(seed))
+                                 for seed in np.random.SeedSequence().spawn(RNG_THREADS)]
+        
+        executor = _get_rng_executor()
+        bounds = np.linspace(0, out.size, len(self._thread_rngs) + 1, dtype=np.int64)
+        futures = [
+            executor.submit(rng.standard_normal, dtype=np.float32, out=out[start:stop])
+            for rng, start, stop in zip(self._thread_rngs, bounds[:-1], bounds[1:])
+        ]
+        for future in futures:
+            future.result()
+        return out
+    
+    def _preprocess_signal(self, signal: np.ndarray,
+                           out: Optional[np.ndarray] = None,
+                           scratch: Optional[np.ndarray] = None) -> np.ndarray:
         """
         信号预处理
         
         Args:
-            signal: 原始信号数据
+            signal: 原始信号数据（归一化时会被原地修改）
+            out: 可选的输出缓冲区，长度须与输入一致
+            scratch: 可选的滤波工作缓冲区（complex128），见 _moving_average
             
         Returns:
             np.ndarray: 预处理后的信号
         """
         try:
-            # 归一化
-            signal_normalized = signal / np.max(np.abs(signal))
+            # 归一化（原地进行，不产生|signal|临时数组）
+            signal_normalized = normalize_inplace(signal)
             
             # 简单的滤波（实际项目中可以使用更复杂的滤波器）
             # 这里使用移动平均滤波器
-            window_size = min(100, len(signal_normalized) // 10)
+            window_size = min(FILTER_WINDOW_SIZE, len(signal_normalized) // 10)
             if window_size > 1:
-                kernel = np.ones(window_size) / window_size
-                signal_filtered = np.convolve(signal_normalized, kernel, mode='same')
+                signal_filtered = _moving_average(signal_normalized, window_size,
+                                                  out=out, scratch=scratch)
+            elif out is not None:
+                out[...] = signal_normalized
+                signal_filtered = out
             else:
                 signal_filtered = signal_normalized
             
@@ -158,20 +407,18 @@ class SignalProcessor:
             amplitude = np.mean(np.abs(data))
             
             # 计算频谱
-            fft_data = np.fft.fft(data)
-            spectrum = np.abs(fft_data)
+            fft_data = fft_backend.fft(data, **FFT_OPTIONS)
             
-            # 找到主频率
-            freqs = np.fft.fftfreq(len(data), 1/signal_data.sample_rate)
-            main_freq_idx = np.argmax(spectrum)
-            main_freq = freqs[main_freq_idx]
+            # 找到主频率（直接在FFT结果上求峰值，不生成完整幅度谱）
+            main_freq_idx, spectrum_peak = peak_magnitude(fft_data)
+            main_freq = _fft_bin_frequency(main_freq_idx, len(data), signal_data.sample_rate)
             
             analysis_result = {
                 'power': float(power),
                 'amplitude': float(amplitude),
                 'main_frequency': float(main_freq),
                 'snr_estimate': float(10 * np.log10(power / (np.var(data) + 1e-10))),
-                'spectrum_peak': float(np.max(spectrum)),
+                'spectrum_peak': float(spectrum_peak),
                 'data_length': len(data)
             }
             
@@ -197,14 +444,15 @@ class SignalProcessor:
             # 确保目录存在
             Path(file_path).parent.mkdir(parents=True, exist_ok=True)
             
-            # 保存为numpy格式
-            np.savez_compressed(
+            # 保存为numpy格式（不压缩：原始IQ样本接近噪声，压缩收益很小但非常耗时）
+            np.savez(
                 file_path,
                 data=signal_data.data,
                 sample_rate=signal_data.sample_rate,
                 center_freq=signal_data.center_freq,
                 timestamp=signal_data.timestamp,
-                metadata=signal_data.metadata
+                # 元数据以JSON字符串保存，读取时无需启用pickle
+                metadata=json.dumps(signal_data.metadata, ensure_ascii=False)
             )
             
             logger.info(f"信号数据已保存到 {file_path}")
@@ -214,6 +462,78 @@ class SignalProcessor:
             logger.error(f"保存信号数据失败: {e}")
             return False
     
+    def save_signal_batch(self, batch: List[SignalData], file_path: str) -> bool:
+        """
+        将多次采集的信号数据保存到同一个文件
+        
+        各次采集的数据分别保存为 data_0000、data_0001 ... 成员，无需拼接复制
+        
+        Args:
+            batch: 信号数据对象列表（采样参数相同）
+            file_path: 保存路径
+            
+        Returns:
+            bool: 保存是否成功
+        """
+        try:
+            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+            
+            arrays = {f"data_{index:04d}": item.data for index, item in enumerate(batch)}
+            np.savez(
+                file_path,
+                sample_rate=batch[0].sample_rate,
+                center_freq=batch[0].center_freq,
+                timestamps=np.array([item.timestamp for item in batch]),
+                metadata=json.dumps(batch[0].metadata, ensure_ascii=False),
+                **arrays
+            )
+            
+            logger.info(f"{len(batch)} 组信号数据已保存到 {file_path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"保存信号数据失败: {e}")
+            return False
+    
+    def save_signal_batch_async(self, batch: List[SignalData], file_path: str) -> bool:
+        """
+        提交一批信号数据到后台写入线程
+        
+        提交后这些数据的缓冲区归处理器所有，写入完成后会被后续采集复用，
+        调用方不应再访问
+        
+        Args:
+            batch: 信号数据对象列表
+            file_path: 保存路径
+            
+        Returns:
+            bool: 提交（或同步保存）是否成功
+        """
+        if self._write_queue is None:
+            return self._save_and_release_batch(batch, file_path)
+        
+        self._write_queue.put((self._save_and_release_batch, (batch, file_path)))
+        return True
+    
+    def _save_and_release_batch(self, batch: List[SignalData], file_path: str) -> bool:
+        """保存一批信号数据，并将其缓冲区归还到缓冲池"""
+        result = self.save_signal_batch(batch, file_path)
+        for item in batch:
+            self._release_output_buffer(item.data)
+        return result
+    
+    def _write_worker(self, write_queue: queue.Queue):
+        """后台写入线程：依次执行队列中的保存任务，收到None时退出"""
+        while True:
+            item = write_queue.get()
+            try:
+                if item is None:
+                    break
+                save_func, args = item
+                save_func(*args)
+            finally:
+                write_queue.task_done()
+    
     def load_signal_data(self, file_path: str) -> Optional[SignalData]:
         """
         从文件加载信号数据
@@ -225,15 +545,19 @@ class SignalProcessor:
             SignalData: 加载的信号数据，失败时返回None
         """
         try:
-            data = np.load(file_path)
-            
-            signal_data = SignalData(
-                data=data['data'],
-                sample_rate=float(data['sample_rate']),
-                center_freq=float(data['center_freq']),
-                timestamp=float(data['timestamp']),
-                metadata=data['metadata'].item() if 'metadata' in data else {}
-            )
+            with np.load(file_path) as archive:
+                # 信号数据以内存映射方式按需读取，读取元数据时不加载整个数组
+                data = _memmap_npz_member(file_path, 'data.npy')
+                if data is None:
+                    data = archive['data']
+                
+                signal_data = SignalData(
+                    data=data,
+                    sample_rate=float(archive['sample_rate']),
+                    center_freq=float(archive['center_freq']),
+                    timestamp=float(archive['timestamp']),
+                    metadata=json.loads(str(archive['metadata'])) if 'metadata' in archive else {}
+                )
             
             logger.info(f"信号数据已从 {file_path} 加载")
             return signal_data
@@ -242,6 +566,44 @@ class SignalProcessor:
             logger.error(f"加载信号数据失败: {e}")
             return None
     
+    def load_signal_batch(self, file_path: str) -> Optional[List[SignalData]]:
+        """
+        从文件加载 save_signal_batch 保存的一批信号数据
+        
+        Args:
+            file_path: 文件路径
+            
+        Returns:
+            List[SignalData]: 加载的信号数据列表，失败时返回None
+        """
+        try:
+            with np.load(file_path) as archive:
+                sample_rate = float(archive['sample_rate'])
+                center_freq = float(archive['center_freq'])
+                timestamps = archive['timestamps']
+                metadata = json.loads(str(archive['metadata'])) if 'metadata' in archive else {}
+                
+                batch = []
+                for index, timestamp in enumerate(timestamps):
+                    member = f"data_{index:04d}"
+                    data = _memmap_npz_member(file_path, f"{member}.npy")
+                    if data is None:
+                        data = archive[member]
+                    batch.append(SignalData(
+                        data=data,
+                        sample_rate=sample_rate,
+                        center_freq=center_freq,
+                        timestamp=float(timestamp),
+                        metadata=dict(metadata)
+                    ))
+            
+            logger.info(f"{len(batch)} 组信号数据已从 {file_path} 加载")
+            return batch
+            
+        except Exception as e:
+            logger.error(f"加载信号数据失败: {e}")
+            return None
+    
     def start_continuous_acquisition(self, output_dir: str = "data") -> bool:
         """
         开始连续信号采集
@@ -259,8 +621,16 @@ class SignalProcessor:
             
             logger.info(f"开始连续信号采集，输出目录：{output_dir}")
             
-            # 这里可以实现连续采集逻辑
-            # 实际项目中可能需要多线程或异步处理
+            # 启动后台写入线程，使下一次采集与本次写盘重叠进行
+            if self._writer_thread is None:
+                self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+                self._writer_thread = threading.Thread(
+                    target=self._write_worker,
+                    args=(self._write_queue,),
+                    name="signal-writer",
+                    daemon=True
+                )
+                self._writer_thread.start()
             
             return True
             
@@ -277,6 +647,14 @@ class SignalProcessor:
         """
         try:
             self.is_running = False
+            
+            # 等待队列中剩余数据写完后再退出写入线程
+            if self._writer_thread is not None:
+                self._write_queue.put(None)
+                self._writer_thread.join()
+                self._writer_thread = None
+                self._write_queue = None
+            
             logger.info("连续信号采集已停止")
             return True
             
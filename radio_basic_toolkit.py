@@ -4,7 +4,6 @@
 整合了参数配置、信号采集模拟和IQ信号处理功能
 """
 
-import json
 import numpy as np
 import os
 import sys
@@ -16,124 +15,44 @@ try:
     from config.config_handler import save_config, load_config
 except ImportError:
     print("警告: 无法导入 config_handler，使用备用实现")
-    # 备用实现
-    def save_config(file_path, config_dict):
-        """保存配置到JSON文件"""
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, indent=4, ensure_ascii=False)
-            print(f"配置已保存到: {file_path}")
-            return True
-        except Exception as e:
-            print(f"保存配置失败: {e}")
-            return False
-
-    def load_config(file_path):
-        """从JSON文件加载配置"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            
-            # 检查关键参数
-            required_params = ['center_freq', 'sample_rate', 'gain', 'device_id']
-            for param in required_params:
-                if param not in config:
-                    raise KeyError(f"缺少关键参数: {param}")
-            
-            return config
-        except FileNotFoundError:
-            print(f"错误: 配置文件不存在 - {file_path}")
-            return None
-        except json.JSONDecodeError:
-            print(f"错误: 配置文件格式错误 - {file_path}")
-            return None
-        except KeyError as e:
-            print(f"错误: {e}")
-            return None
-        except Exception as e:
-            print(f"加载配置时发生未知错误: {e}")
-            return None
+    from radio_toolkit_fallback import save_config, load_config
 
 try:
     from signal_process.signal_processor import create_iq_array, process_iq_data
 except ImportError:
     print("警告: 无法导入 signal_processor，使用备用实现")
-    # 备用实现
-    def create_iq_array(iq_data_list=None, sample_rate=None):
-        """创建IQ信号数组"""
-        if iq_data_list is None:
-            # 创建空的IQ数据
-            iq_array = np.zeros((1000, 2), dtype=np.float32)
-        else:
-            # 转换为NumPy数组
-            iq_array = np.array(iq_data_list, dtype=np.float32)
-        
-        # 添加采样率标注
-        if sample_rate is not None:
-            # 在数组末尾添加一行标注信息
-            info_row = np.array([[sample_rate, 0]], dtype=np.float32)
-            iq_array = np.vstack([iq_array, info_row])
-        
-        return iq_array
-
-    def process_iq_data(iq_array):
-        """处理IQ数据"""
-        print(f"数组维度: {iq_array.shape}")
-        print(f"数据类型: {iq_array.dtype}")
-        
-        # 提取前200组信号
-        first_200 = iq_array[:200]
-        print(f"前200组信号形状: {first_200.shape}")
-        
-        # 提取所有Q分量（排除最后一行标注）
-        q_components = iq_array[:-1, 1] if iq_array.shape[0] > 1 else iq_array[:, 1]
-        print(f"Q分量数量: {len(q_components)}")
-        
-        # 计算I分量均值（排除最后一行标注）
-        i_components = iq_array[:-1, 0] if iq_array.shape[0] > 1 else iq_array[:, 0]
-        i_mean = np.mean(i_components)
-        print(f"I分量均值: {i_mean}")
-        
-        # 滤波处理：将大于均值的I分量设为0
-        filtered_i = np.where(i_components > i_mean, 0, i_components)
-        
-        return {
-            'original_i': i_components,
-            'filtered_i': filtered_i,
-            'q_components': q_components,
-            'i_mean': i_mean
-        }
+    from radio_toolkit_fallback import create_iq_array, process_iq_data
 
 # 信号采集模拟功能
-def simulate_signal_collect(duration, sample_rate):
+# 模块级随机数生成器（PCG64），避免每次调用重新创建
+_rng = np.random.default_rng()
+
+def simulate_signal_collect(duration, sample_rate, as_list=False):
     """
     模拟信号采集过程
     
     参数:
         duration: 采集时长(秒)
         sample_rate: 采样率(Hz)
+        as_list: 是否返回Python列表（兼容旧调用方），默认返回NumPy数组
     
     返回:
-        生成的IQ数据列表
+        生成的IQ数据数组，形状为 (样本数, 2)，每行为一组 [I, Q]；
+        as_list为True时返回 [[I1, Q1], [I2, Q2], ...] 列表
     """
     if sample_rate < 1e6:
         print("警告: 采样率过低，可能导致信号失真")
     
     total_samples = int(duration * sample_rate)
-    iq_data = []
-    
-    # 模拟采集过程
-    for i in range(total_samples // 100):  # 每次循环生成100个样本
-        # 生成随机IQ数据 (I分量和Q分量)
-        i_samples = np.random.randn(100).tolist()  # I分量
-        q_samples = np.random.randn(100).tolist()  # Q分量
-        
-        # 组合成IQ对
-        for i_val, q_val in zip(i_samples, q_samples):
-            iq_data.append([i_val, q_val])
+    
+    # 模拟采集过程：一次性生成全部随机IQ数据 (第0列为I分量，第1列为Q分量)
+    # 按列存储，I、Q分量各自连续，便于后续逐分量处理；
+    # 直接以float32生成，与后续处理使用的数据类型一致，无需再转换
+    iq_data = np.empty((total_samples, 2), dtype=np.float32, order='F')
+    _rng.standard_normal(dtype=np.float32, out=iq_data)
     
     print(f"模拟采集完成: 时长{duration}秒, 采样率{sample_rate}Hz, 生成{len(iq_data)}组IQ数据")
-    return iq_data
+    return iq_data.tolist() if as_list else iq_data
 
 # 测试工具包完整流程
 def test_toolkit():
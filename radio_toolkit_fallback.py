@@ -0,0 +1,117 @@
+# radio_toolkit_fallback.py
+"""
+无线电基础工具包的备用实现
+在无法导入 config_handler / 信号处理模块时，由 radio_basic_toolkit 及其备份版本共用
+"""
+
+import functools
+import json
+import numpy as np
+import os
+
+# 计算内核可导入时直接复用，否则使用等价的NumPy实现
+try:
+    from signal_process.kernels import component_mean, zero_above
+except ImportError:
+    def component_mean(values):
+        """计算单个分量的均值"""
+        return np.mean(values)
+
+    def zero_above(values, threshold):
+        """将大于阈值的元素置零（复制后按布尔掩码直接赋值）"""
+        filtered = values.copy()
+        filtered[values > threshold] = 0
+        return filtered
+
+# 配置文件必须包含的关键参数
+_REQUIRED_CONFIG_KEYS = frozenset(('center_freq', 'sample_rate', 'gain', 'device_id'))
+
+def save_config(file_path, config_dict):
+    """保存配置到JSON文件"""
+    try:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(config_dict, f, indent=4, ensure_ascii=False)
+        print(f"配置已保存到: {file_path}")
+        # 文件时间戳精度有限，写入后主动清除读取缓存
+        _read_config_file.cache_clear()
+        return True
+    except Exception as e:
+        print(f"保存配置失败: {e}")
+        return False
+
+@functools.lru_cache(maxsize=16)
+def _read_config_file(file_path, mtime_ns, size):
+    """读取并解析配置文件，按 (路径, 修改时间, 文件大小) 缓存，文件修改后自动失效"""
+    with open(file_path, 'rb') as f:
+        return json.loads(f.read())
+
+def load_config(file_path):
+    """从JSON文件加载配置"""
+    try:
+        stat = os.stat(file_path)
+        config = _read_config_file(file_path, stat.st_mtime_ns, stat.st_size).copy()
+        
+        # 检查关键参数
+        missing = _REQUIRED_CONFIG_KEYS.difference(config)
+        if missing:
+            raise KeyError(f"缺少关键参数: {', '.join(sorted(missing))}")
+        
+        return config
+    except FileNotFoundError:
+        print(f"错误: 配置文件不存在 - {file_path}")
+        return None
+    except json.JSONDecodeError:
+        print(f"错误: 配置文件格式错误 - {file_path}")
+        return None
+    except KeyError as e:
+        print(f"错误: {e}")
+        return None
+    except Exception as e:
+        print(f"加载配置时发生未知错误: {e}")
+        return None
+
+def create_iq_array(iq_data_list=None, sample_rate=None):
+    """
+    创建IQ信号数组
+    
+    采样率不再作为标注行追加到数组末尾，由调用方单独保存；
+    保留 sample_rate 参数以兼容原有调用方式
+    
+    数组按列（Fortran顺序）存储，I、Q分量各自占用连续内存
+    """
+    if iq_data_list is None:
+        # 创建空的IQ数据
+        iq_array = np.zeros((1000, 2), dtype=np.float32, order='F')
+    else:
+        # 转换为NumPy数组；输入已是按列存储的float32数组时直接复用，不再复制
+        iq_array = np.asarray(iq_data_list, dtype=np.float32, order='F')
+    
+    return iq_array
+
+def process_iq_data(iq_array):
+    """处理IQ数据"""
+    print(f"数组维度: {iq_array.shape}")
+    print(f"数据类型: {iq_array.dtype}")
+    
+    # 提取前200组信号
+    first_200 = iq_array[:200]
+    print(f"前200组信号形状: {first_200.shape}")
+    
+    # 提取所有Q分量
+    q_components = iq_array[:, 1]
+    print(f"Q分量数量: {len(q_components)}")
+    
+    # 计算I分量均值
+    i_components = iq_array[:, 0]
+    i_mean = component_mean(i_components)
+    print(f"I分量均值: {i_mean}")
+    
+    # 滤波处理：将大于均值的I分量设为0
+    filtered_i = zero_above(i_components, i_mean)
+    
+    return {
+        'original_i': i_components,
+        'filtered_i': filtered_i,
+        'q_components': q_components,
+        'i_mean': i_mean
+    }